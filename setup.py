@@ -83,6 +83,9 @@ setup(
             'Sphinx',
             'repoze.sphinx.autointerface',
         ],
+        'parallel': [
+            'futures; python_version == "2.7"',
+        ],
         'test': TESTS_REQUIRE,
     },
 )
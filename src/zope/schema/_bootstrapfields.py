@@ -18,6 +18,7 @@ __docformat__ = 'restructuredtext'
 import decimal
 import fractions
 import numbers
+import os
 import sys
 import threading
 import unicodedata
@@ -30,7 +31,6 @@ from zope.interface import providedBy
 from zope.interface import implementer
 from zope.interface.interface import InterfaceClass
 from zope.interface.interfaces import IInterface
-from zope.interface.interfaces import IMethod
 
 from zope.event import notify
 
@@ -301,6 +301,65 @@ class Field(Attribute):
             except StopValidation:
                 pass
 
+    def validate_many(self, values, parallel=False):
+        """
+        Validate each of the *values*, collecting the errors instead of
+        raising them.
+
+        Returns a tuple ``(valid, errors)``: a list of the indexes of
+        the valid values, in order, and a dictionary mapping the index
+        of each invalid value to its
+        :class:`~zope.schema.interfaces.ValidationError`.
+
+        If *parallel* is true, the values are validated concurrently
+        in the pool of threads also used by :class:`Object` fields with
+        *validate_parallel*. This can help when validation blocks, but
+        not when it is CPU-bound. The same constraints apply as for
+        `get_schema_validation_errors`: the threads don't share the
+        caller's thread-local state, such as the ``zope.component``
+        site that named vocabularies are looked up in, or the
+        ``zope.security`` interaction. Values that fail to validate in
+        a thread are validated again in the calling thread, and only
+        the errors found there are reported. On Python 2, this
+        requires the ``futures`` backport (install
+        ``zope.schema[parallel]``); without it, the values are
+        validated sequentially.
+
+        .. versionadded:: 6.2.0
+        """
+        validating_objects = _objects_being_validated
+        if (parallel
+                and not validating_objects.in_executor
+                and _can_validate_in_threads()):
+            values = list(values)
+            executor = _get_validation_executor()
+            ids = frozenset(validating_objects.ids_being_validated)
+            futures = [
+                executor.submit(_call_in_executor,
+                                validating_objects, ids,
+                                _get_validation_error, self, value)
+                for value in values
+            ]
+            results = [future.result() for future in futures]
+            # An error may only be due to thread-local state the worker
+            # thread didn't have; see if it happens here too.
+            results = [
+                None if error is None else _get_validation_error(self, value)
+                for value, error in zip(values, results)
+            ]
+        else:
+            results = (_get_validation_error(self, value)
+                       for value in values)
+
+        valid = []
+        errors = {}
+        for index, error in enumerate(results):
+            if error is None:
+                valid.append(index)
+            else:
+                errors[index] = error
+        return valid, errors
+
     def __get_property_names_to_compare(self):
         # Return the set of property names to compare, ignoring
         # order
@@ -345,9 +404,10 @@ class Field(Attribute):
         return not self.__eq__(other)
 
     def _validate(self, value):
-        if self._type is not None and not isinstance(value, self._type):
+        _type = self._type
+        if _type is not None and not isinstance(value, _type):
             raise WrongType(
-                value, self._type, self.__name__
+                value, _type, self.__name__
             ).with_field_and_value(self, value)
 
         try:
@@ -491,11 +551,14 @@ class Orderable(object):
     def _validate(self, value):
         super(Orderable, self)._validate(value)
 
-        if self.min is not None and value < self.min:
-            raise TooSmall(value, self.min).with_field_and_value(self, value)
+        # min and max are (Python) descriptors; only look them up once.
+        min_value = self.min
+        if min_value is not None and value < min_value:
+            raise TooSmall(value, min_value).with_field_and_value(self, value)
 
-        if self.max is not None and value > self.max:
-            raise TooBig(value, self.max).with_field_and_value(self, value)
+        max_value = self.max
+        if max_value is not None and value > max_value:
+            raise TooBig(value, max_value).with_field_and_value(self, value)
 
 
 class MinMaxLen(object):
@@ -514,12 +577,20 @@ class MinMaxLen(object):
     def _validate(self, value):
         super(MinMaxLen, self)._validate(value)
 
-        if self.min_length is not None and len(value) < self.min_length:
-            raise TooShort(value, self.min_length).with_field_and_value(
+        # min_length and max_length are usually FieldProperty descriptors
+        # (see zope.schema._field); only look them up once.
+        min_length = self.min_length
+        max_length = self.max_length
+        if min_length is None and max_length is None:
+            return
+
+        length = len(value)
+        if min_length is not None and length < min_length:
+            raise TooShort(value, min_length).with_field_and_value(
                 self, value)
 
-        if self.max_length is not None and len(value) > self.max_length:
-            raise TooLong(value, self.max_length).with_field_and_value(
+        if max_length is not None and length > max_length:
+            raise TooLong(value, max_length).with_field_and_value(
                 self, value)
 
 
@@ -1006,15 +1077,128 @@ class Decimal(Number):
     _validation_error = InvalidDecimalLiteral
 
 
+def _get_schema_fields(schema):
+    """
+    Return a tuple of ``(name, field)`` pairs for each validatable
+    member of *schema*, including inherited ones.
+
+    This is computed once and cached on the schema (with a volatile
+    attribute, much like zope.interface caches its own attribute
+    lookups) until the schema's resolution order changes, e.g.,
+    because its ``__bases__`` were modified.
+    """
+    # Interfaces hash and compare equal by name and module, so a
+    # separate mapping could confuse distinct schemas with the same name.
+    iro = schema.__iro__
+    cached = getattr(schema, '_v_zope_schema_fields', None)
+    if cached is not None and cached[0] is iro:
+        return cached[1]
+
+    fields = []
+    for name in schema.names(all=True):
+        attribute = schema[name]
+        if IValidatable.providedBy(attribute):
+            fields.append((name, attribute))
+    fields = tuple(fields)
+    schema._v_zope_schema_fields = (iro, fields)
+    return fields
+
+
 class _ObjectsBeingValidated(threading.local):
 
     def __init__(self):
         super(_ObjectsBeingValidated, self).__init__()
         self.ids_being_validated = set()
+        # Whether this is one of the threads of the shared validation
+        # executor; those never hand work off to the executor themselves.
+        self.in_executor = False
+
+
+_objects_being_validated = _ObjectsBeingValidated()
+
+# The maximum number of threads used to validate schema fields in
+# parallel (see the *validate_parallel* argument of `Object`).
+_VALIDATION_MAX_WORKERS = 8
+
+_validation_executor = (None, None)  # (executor, pid)
+_validation_executor_lock = threading.Lock()
+
+# Whether concurrent.futures can be imported; None until first asked.
+_threads_available = None
+
+
+def _can_validate_in_threads():
+    # Parallel validation is off by default, so concurrent.futures (and
+    # the logging package it imports) is only imported once it's used.
+    global _threads_available
+    if _threads_available is None:
+        try:
+            import concurrent.futures  # noqa: F401
+        except ImportError:  # pragma: PY2
+            # Python 2 without the ``futures`` backport.
+            _threads_available = False
+        else:
+            _threads_available = True
+    return _threads_available
+
+
+def _get_validation_executor():
+    # Create the shared executor on demand, and create it anew in a
+    # forked child, which doesn't inherit the parent's threads.
+    global _validation_executor
+    with _validation_executor_lock:
+        executor, pid = _validation_executor
+        if executor is None or pid != os.getpid():
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=_VALIDATION_MAX_WORKERS)
+            _validation_executor = (executor, os.getpid())
+        return executor
+
+
+def _get_field_validation_error(field, name, value):
+    # Validate the attribute *name* of *value* with *field*, returning the
+    # error, or None if the attribute is valid.
+    try:
+        field_value = getattr(value, name)
+        field = field.bind(value)
+        field.validate(field_value)
+    except ValidationError as error:
+        return error
+    except AttributeError as error:
+        # property for the given name is not implemented
+        return SchemaNotFullyImplemented(
+            error
+        ).with_field_and_value(field, None)
+    return None
+
+
+def _get_validation_error(field, value):
+    # Validate *value* with *field*, returning the error, or None if
+    # the value is valid.
+    try:
+        field.validate(value)
+    except ValidationError as error:
+        return error
+    return None
+
+
+def _call_in_executor(validating_objects, ids_being_validated,
+                      func, *args):
+    # Run in a thread of the validation executor. Begin with the objects
+    # the submitting thread is validating so that cycles are still
+    # detected.
+    saved_ids = validating_objects.ids_being_validated
+    validating_objects.ids_being_validated = set(ids_being_validated)
+    validating_objects.in_executor = True
+    try:
+        return func(*args)
+    finally:
+        validating_objects.ids_being_validated = saved_ids
+        validating_objects.in_executor = False
 
 
-def get_schema_validation_errors(schema, value,
-                                 _validating_objects=_ObjectsBeingValidated()):
+def get_schema_validation_errors(schema, value, parallel=False,
+                                 _validating_objects=_objects_being_validated):
     """
     Validate that *value* conforms to the schema interface *schema*.
 
@@ -1022,8 +1206,33 @@ def get_schema_validation_errors(schema, value,
     are validated after being bound to *value*. (Note that we do not check for
     arbitrary :class:`zope.interface.Attribute` members being present.)
 
+    If *parallel* is true, the fields are validated concurrently using
+    a shared pool of threads. This can help when getting the attribute
+    values blocks, but only use it when both of these hold:
+
+    - The attributes of *value* can be read from several threads at
+      once. This is **not** the case for ZODB persistent objects or
+      objects attached to an SQLAlchemy session, for example.
+    - Validation doesn't depend on thread-local state, which the
+      threads don't share with the caller. Examples are the current
+      ``zope.component`` site (used to look up named vocabularies),
+      the ``zope.security`` interaction, and database connections.
+
+    Fields that fail to validate in a thread are validated again in the
+    calling thread, and only the errors found there are reported, so
+    missing thread-local state can't turn a valid object into an
+    invalid one. But a field that validates in a thread is trusted.
+
+    Any nested validation (e.g., of `Object` fields) happens
+    sequentially in those threads. If threads are not available
+    (Python 2 without the ``futures`` backport, installed by the
+    ``parallel`` extra), validation is sequential.
+
     :return: A `dict` mapping field names to `ValidationError` subclasses.
        A non-empty return value means that validation failed.
+
+    .. versionchanged:: 6.2.0
+       Add the *parallel* argument.
     """
     errors = {}
     # Interface can be used as schema property for Object fields that plan to
@@ -1046,38 +1255,53 @@ def get_schema_validation_errors(schema, value,
     # iow, we can rely on the fact that it is an instance
     # that supports attribute assignment.)
 
+    fields = _get_schema_fields(schema)
+    # Running tasks in the executor that wait on other tasks in the same
+    # executor could deadlock, so its threads validate sequentially.
+    parallel = (parallel
+                and len(fields) > 1
+                and not _validating_objects.in_executor
+                and _can_validate_in_threads())
     try:
-        for name in schema.names(all=True):
-            attribute = schema[name]
-            if IMethod.providedBy(attribute):
-                continue  # pragma: no cover
-
-            try:
-                if IValidatable.providedBy(attribute):
-                    # validate attributes that are fields
-                    field_value = getattr(value, name)
-                    attribute = attribute.bind(value)
-                    attribute.validate(field_value)
-            except ValidationError as error:
-                errors[name] = error
-            except AttributeError as error:
-                # property for the given name is not implemented
-                errors[name] = SchemaNotFullyImplemented(
-                    error
-                ).with_field_and_value(attribute, None)
+        if parallel:
+            executor = _get_validation_executor()
+            ids = frozenset(ids_being_validated)
+            futures = [
+                executor.submit(
+                    _call_in_executor,
+                    _validating_objects, ids,
+                    _get_field_validation_error, attribute, name, value)
+                for name, attribute in fields
+            ]
+            results = [future.result() for future in futures]
+            for (name, attribute), error in zip(fields, results):
+                if error is not None:
+                    # The error may only be due to thread-local state
+                    # the worker thread didn't have; see if it happens
+                    # here too.
+                    error = _get_field_validation_error(attribute, name,
+                                                        value)
+                if error is not None:
+                    errors[name] = error
+        else:
+            for name, attribute in fields:
+                error = _get_field_validation_error(attribute, name, value)
+                if error is not None:
+                    errors[name] = error
     finally:
         ids_being_validated.remove(id_value)
     return errors
 
 
-def get_validation_errors(schema, value, validate_invariants=True):
+def get_validation_errors(schema, value, validate_invariants=True,
+                          parallel=False):
     """
     Validate that *value* conforms to the schema interface *schema*.
 
     This includes checking for any schema validation errors (using
-    `get_schema_validation_errors`). If that succeeds, and
-    *validate_invariants* is true, then we proceed to check for any
-    declared invariants.
+    `get_schema_validation_errors`, passing along *parallel*). If that
+    succeeds, and *validate_invariants* is true, then we proceed to check
+    for any declared invariants.
 
     Note that this does not include a check to see if the *value*
     actually provides the given *schema*.
@@ -1086,8 +1310,11 @@ def get_validation_errors(schema, value, validate_invariants=True):
              invariant, return a two tuple (schema_error_dict,
              invariant_error_list). If there were no errors, returns a
              two-tuple where both members are empty.
+
+    .. versionchanged:: 6.2.0
+       Add the *parallel* argument.
     """
-    schema_error_dict = get_schema_validation_errors(schema, value)
+    schema_error_dict = get_schema_validation_errors(schema, value, parallel)
     invariant_errors = []
     # Only validate invariants if there were no previous errors. Previous
     # errors could be missing attributes which would most likely make an
@@ -1111,10 +1338,12 @@ class Object(Field):
     Implementation of :class:`zope.schema.interfaces.IObject`.
     """
     schema = None
+    validate_parallel = False
 
     def __init__(self, schema=_NotGiven, **kw):
         """
-        Object(schema=<Not Given>, *, validate_invariants=True, **kwargs)
+        Object(schema=<Not Given>, *, validate_invariants=True,
+               validate_parallel=False, **kwargs)
 
         Create an `~.IObject` field. The keyword arguments are as for
         `~.Field`.
@@ -1126,6 +1355,15 @@ class Object(Field):
         .. versionchanged:: 4.6.0
            The *schema* argument can be ommitted in a subclass
            that specifies a ``schema`` attribute.
+        .. versionchanged:: 6.2.0
+           Add the keyword argument *validate_parallel*. When true, the
+           fields of the schema are validated concurrently in a pool of
+           threads. Only use this for values whose attributes can be read
+           from several threads at once (**not**, for example, ZODB
+           persistent objects), and whose validation doesn't depend on
+           thread-local state such as the ``zope.component`` site or the
+           ``zope.security`` interaction; see
+           `get_schema_validation_errors`.
         """
         if schema is _NotGiven:
             schema = self.schema
@@ -1138,6 +1376,7 @@ class Object(Field):
 
         self.schema = schema
         self.validate_invariants = kw.pop('validate_invariants', True)
+        self.validate_parallel = kw.pop('validate_parallel', False)
         super(Object, self).__init__(**kw)
 
     def getExtraDocLines(self):
@@ -1158,7 +1397,8 @@ class Object(Field):
         schema_error_dict, invariant_errors = get_validation_errors(
             self.schema,
             value,
-            self.validate_invariants
+            self.validate_invariants,
+            self.validate_parallel,
         )
 
         if schema_error_dict or invariant_errors:
@@ -1193,7 +1433,15 @@ class Object(Field):
 
 @implementer(IBeforeObjectAssignedEvent)
 class BeforeObjectAssignedEvent(object):
-    """An object is going to be assigned to an attribute on another object."""
+    """An object is going to be assigned to an attribute on another object.
+
+    .. versionchanged:: 6.2.0
+       Use ``__slots__``; one of these is created for every assignment.
+    """
+
+    # __provides__ lets subscribers still declare interfaces directly
+    # provided by the event.
+    __slots__ = ('object', 'name', 'context', '__provides__')
 
     def __init__(self, object, name, context):
         self.object = object
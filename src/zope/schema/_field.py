@@ -219,6 +219,24 @@ class NativeString(Text if PY3 else Bytes):
             return value
 
 
+# Check that a (non-empty) native string contains only ASCII
+# characters, scanning it in C rather than one character at a time.
+if PY3:  # pragma: PY3
+    if hasattr(str, 'isascii'):  # pragma: no branch
+        _is_ascii = str.isascii
+    else:  # pragma: no cover
+        # Python 3.5 and 3.6
+        def _is_ascii(value):
+            try:
+                value.encode('ascii')
+            except UnicodeEncodeError:
+                return False
+            return True
+else:  # pragma: PY2
+    def _is_ascii(value):
+        return max(bytearray(value)) < 128
+
+
 @implementer(IASCII)
 class ASCII(NativeString):
     __doc__ = IASCII.__doc__
@@ -227,7 +245,7 @@ class ASCII(NativeString):
         super(ASCII, self)._validate(value)
         if not value:
             return
-        if not max(map(ord, value)) < 128:
+        if not _is_ascii(value):
             raise InvalidValue().with_field_and_value(self, value)
 
 
@@ -420,24 +438,25 @@ class Choice(Field):
                 "You cannot specify both values and vocabulary."
             )
 
+        # Before a default value is checked, it is validated. However, a
+        # named vocabulary is usually not complete when these fields are
+        # initialized. Therefore signal the validation method to ignore
+        # default value checks during initialization of a Choice tied to a
+        # registered vocabulary.
         self.vocabulary = None
         self.vocabularyName = None
         if values is not None:
             self.vocabulary = SimpleVocabulary.fromValues(values)
+            self._init_field = False
         elif isinstance(vocabulary, string_types):
             self.vocabularyName = vocabulary
+            self._init_field = bool(vocabulary)
         else:
-            if (not ISource.providedBy(vocabulary)
-                    and not IContextSourceBinder.providedBy(vocabulary)):
+            is_binder = IContextSourceBinder.providedBy(vocabulary)
+            if not is_binder and not ISource.providedBy(vocabulary):
                 raise InvalidVocabularyError(vocabulary)
             self.vocabulary = vocabulary
-        # Before a default value is checked, it is validated. However, a
-        # named vocabulary is usually not complete when these fields are
-        # initialized. Therefore signal the validation method to ignore
-        # default value checks during initialization of a Choice tied to a
-        # registered vocabulary.
-        self._init_field = (bool(self.vocabularyName) or
-                            IContextSourceBinder.providedBy(self.vocabulary))
+            self._init_field = is_binder
         super(Choice, self).__init__(**kw)
         self._init_field = False
 
@@ -448,8 +467,10 @@ class Choice(Field):
         # an exception if this isn't possible, and returning
         # an ISource otherwise.
         vocabulary = self.vocabulary
-        if (IContextSourceBinder.providedBy(vocabulary)
-                and self.context is not None):
+        # Without a context there is nothing to call a binder with,
+        # so don't ask the interface machinery about it.
+        if (self.context is not None
+                and IContextSourceBinder.providedBy(vocabulary)):
             vocabulary = vocabulary(self.context)
         elif vocabulary is None and self.vocabularyName is not None:
             vr = getVocabularyRegistry()
@@ -507,14 +528,18 @@ class _StrippedNativeStringLine(NativeStringLine):
         # On Python 2, self._type is bytes, so we need to encode
         # unicode down to ASCII bytes. On Python 3, self._type is
         # unicode, but we don't want to allow non-ASCII values, to match
-        # Python 2 (our regexs would reject that anyway.)
-        try:
-            v = v.encode('ascii')  # bytes
-        except UnicodeEncodeError:
-            raise self._invalid_exc_type(value).with_field_and_value(
-                self, value)
-        if not isinstance(v, self._type):  # pragma: no branch
-            v = v.decode('ascii')
+        # Python 2 (our validators would reject that anyway.)
+        if PY3:  # pragma: PY3
+            # Check in place rather than round-tripping through bytes.
+            if not _is_ascii(v):
+                raise self._invalid_exc_type(value).with_field_and_value(
+                    self, value)
+        else:  # pragma: PY2
+            try:
+                v = v.encode('ascii')  # bytes
+            except UnicodeEncodeError:
+                raise self._invalid_exc_type(value).with_field_and_value(
+                    self, value)
         self.validate(v)
         return v
 
@@ -522,9 +547,9 @@ class _StrippedNativeStringLine(NativeStringLine):
         return self.fromUnicode(value.decode('ascii'))
 
 
-_isuri = r"[a-zA-z0-9+.-]+:"  # scheme
-_isuri += r"\S*$"  # non space (should be pickier)
-_isuri = re.compile(_isuri).match
+# A scheme, followed by a colon and any number of non-space
+# characters (should be pickier).
+_isuri = re.compile(r"[a-zA-Z0-9+.-]+:\S*\Z").match
 
 
 @implementer(IURI)
@@ -555,19 +580,21 @@ class URI(_StrippedNativeStringLine):
 
 
 # An identifier is a letter or underscore, followed by
-# any number of letters, underscores, and digits.
-_identifier_pattern = r'[a-zA-Z_]+\w*'
+# any number of letters, underscores, and digits. (Don't repeat the
+# first character class: ``[a-zA-Z_]+\w*`` can split a long run of
+# letters in quadratically many ways before failing.)
+_identifier_pattern = r'[a-zA-Z_]\w*'
 
 # The whole string must match to be an identifier
-_is_identifier = re.compile('^' + _identifier_pattern + '$').match
+_is_identifier = re.compile('^' + _identifier_pattern + r'\Z').match
 
 _isdotted = re.compile(
-    # The start of the line, followed by an identifier,
+    # The start of the string, followed by an identifier,
     '^' + _identifier_pattern
     # optionally followed by .identifier any number of times
-    + r"([.]" + _identifier_pattern + r")*"
-    # followed by the end of the line.
-    + r"$").match
+    + r"(?:[.]" + _identifier_pattern + r")*"
+    # followed by the end of the string.
+    + r"\Z").match
 
 
 @implementer(IPythonIdentifier)
@@ -642,14 +669,19 @@ class DottedName(_StrippedNativeStringLine):
         super(DottedName, self)._validate(value)
         if not _isdotted(value):
             raise InvalidDottedName(value).with_field_and_value(self, value)
+        min_dots = self.min_dots
+        max_dots = self.max_dots
+        # With the default bounds, any number of dots will do.
+        if not min_dots and max_dots is None:
+            return
         dots = value.count(".")
-        if dots < self.min_dots:
+        if dots < min_dots:
             raise InvalidDottedName(
-                "too few dots; %d required" % self.min_dots, value
+                "too few dots; %d required" % min_dots, value
             ).with_field_and_value(self, value)
-        if self.max_dots is not None and dots > self.max_dots:
+        if max_dots is not None and dots > max_dots:
             raise InvalidDottedName(
-                "too many dots; no more than %d allowed" % self.max_dots, value
+                "too many dots; no more than %d allowed" % max_dots, value
             ).with_field_and_value(self, value)
 
 
@@ -724,22 +756,38 @@ def _validate_sequence(value_type, value, errors=None):
         errors = []
     if value_type is None:
         return errors
+    # Avoid looking these up (and binding the methods) for every item.
+    validate = value_type.validate
+    append = errors.append
     for item in value:
         try:
-            value_type.validate(item)
+            validate(item)
         except ValidationError as error:
-            errors.append(error)
+            append(error)
     return errors
 
 
 def _validate_uniqueness(self, value):
-    temp_values = []
+    # Hashable items are looked up in a set; unhashable ones (lists,
+    # dicts...) can only be compared with everything seen so far one
+    # by one. Note that a set looks up an unhashable set as a frozenset,
+    # so it may only be the add that raises.
+    seen = set()
+    unhashable = []
     for item in value:
-        if item in temp_values:
+        try:
+            duplicate = item in seen
+            seen.add(item)
+        except TypeError:
+            duplicate = (item in unhashable
+                         or any(item == other for other in seen))
+            unhashable.append(item)
+        else:
+            if not duplicate and unhashable:
+                duplicate = item in unhashable
+        if duplicate:
             raise NotUnique(item).with_field_and_value(self, value)
 
-        temp_values.append(item)
-
 
 @implementer(ICollection)
 class Collection(MinMaxLen, Iterable):
@@ -881,11 +929,29 @@ class Mapping(MinMaxLen, Iterable):
 
     def _validate(self, value):
         super(Mapping, self)._validate(value)
+        key_type = self.key_type
+        value_type = self.value_type
         errors = []
-        if self.value_type:
-            errors = _validate_sequence(self.value_type, value.values(),
-                                        errors)
-        errors = _validate_sequence(self.key_type, value, errors)
+        if key_type is not None and value_type is not None:
+            # Check keys and values in a single pass over the mapping,
+            # still reporting all the value errors before the key errors.
+            key_errors = []
+            validate_key = key_type.validate
+            validate_value = value_type.validate
+            for key, item in value.items():
+                try:
+                    validate_value(item)
+                except ValidationError as error:
+                    errors.append(error)
+                try:
+                    validate_key(key)
+                except ValidationError as error:
+                    key_errors.append(error)
+            errors.extend(key_errors)
+        elif value_type is not None:
+            _validate_sequence(value_type, value.values(), errors)
+        else:
+            _validate_sequence(key_type, value, errors)
 
         if errors:
             try:
@@ -855,6 +855,8 @@ class IObject(IField):
 
     .. versionchanged:: 4.6.0
        Add the *validate_invariants* attribute.
+    .. versionchanged:: 6.2.0
+       Add the *validate_parallel* attribute.
     """
 
     schema = Object(
@@ -871,6 +873,20 @@ class IObject(IField):
         default=True,
     )
 
+    validate_parallel = Bool(
+        title=_("Validate In Parallel"),
+        description=_("A boolean that says whether the fields of the "
+                      "schema are validated concurrently, using "
+                      "threads. Only use this if the attributes of the "
+                      "value can be read from several threads at once "
+                      "(which is not the case for ZODB persistent "
+                      "objects, for example), and if validation doesn't "
+                      "depend on thread-local state, such as the "
+                      "zope.component site or the zope.security "
+                      "interaction. The default is false."),
+        default=False,
+    )
+
 
 class IMapping(IMinMaxLen, IIterable, IContainer):
     """
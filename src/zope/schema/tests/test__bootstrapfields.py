@@ -745,6 +745,69 @@ class FieldTests(EqualityTestsMixin,
         self.assertIs(exc.exception.field, self)
         self.assertIs(exc.exception.value, self)
 
+    def _check_validate_many(self, parallel):
+        from zope.schema._bootstrapinterfaces import RequiredMissing
+        from zope.schema._bootstrapinterfaces import WrongType
+        field = self._makeOne()
+        field._type = int
+        valid, errors = field.validate_many(iter([1, 'a', None, 2]),
+                                            parallel=parallel)
+        self.assertEqual(valid, [0, 3])
+        self.assertEqual(sorted(errors), [1, 2])
+        self.assertIsInstance(errors[1], WrongType)
+        self.assertIs(errors[1].field, field)
+        self.assertEqual(errors[1].value, 'a')
+        self.assertIsInstance(errors[2], RequiredMissing)
+
+    def test_validate_many(self):
+        self._check_validate_many(parallel=False)
+
+    def _shutDownExecutor(self):
+        from zope.schema import _bootstrapfields
+        executor, _ = _bootstrapfields._validation_executor
+        if executor is not None:
+            executor.shutdown()
+            _bootstrapfields._validation_executor = (None, None)
+
+    def test_validate_many_parallel(self):
+        from zope.schema import _bootstrapfields
+        self.addCleanup(self._shutDownExecutor)
+        self._check_validate_many(parallel=True)
+        executor, _ = _bootstrapfields._validation_executor
+        self.assertIsNotNone(executor)
+
+    def test_validate_many_parallel_w_thread_local_state(self):
+        # Validation that depends on the thread-local state of the
+        # caller (like a site-based vocabulary lookup) gives the same
+        # result as sequential validation.
+        import threading
+        from zope.schema._bootstrapinterfaces import ConstraintNotSatisfied
+        self.addCleanup(self._shutDownExecutor)
+        local = threading.local()
+        local.allowed = {1, 2}
+        field = self._makeOne(
+            constraint=lambda value: value in getattr(local, 'allowed', ()))
+        valid, errors = field.validate_many([1, 2, 3], parallel=True)
+        self.assertEqual(valid, [0, 1])
+        self.assertEqual(list(errors), [2])
+        self.assertIsInstance(errors[2], ConstraintNotSatisfied)
+
+    def test_validate_many_parallel_in_executor(self):
+        # Threads of the executor don't submit more work to it.
+        from zope.schema import _bootstrapfields
+        self.addCleanup(self._shutDownExecutor)
+        validating_objects = _bootstrapfields._objects_being_validated
+        validating_objects.in_executor = True
+        try:
+            self._check_validate_many(parallel=True)
+        finally:
+            validating_objects.in_executor = False
+        self.assertEqual(_bootstrapfields._validation_executor, (None, None))
+
+    def test_validate_many_empty(self):
+        field = self._makeOne()
+        self.assertEqual(field.validate_many(()), ([], {}))
+
     def test_get_miss(self):
         field = self._makeOne(__name__='nonesuch')
         inst = DummyInst()
@@ -865,6 +928,21 @@ class IterableTests(ContainerTests):
         self.assertIs(not_it.field, itr)
         self.assertIs(not_it.value, dummy)
 
+    def test__validate_cooperates_w_container_subclass(self):
+        from zope.schema._bootstrapfields import Container
+        validated = []
+
+        class AuditedContainer(Container):
+            def _validate(self, value):
+                validated.append(value)
+                super(AuditedContainer, self)._validate(value)
+
+        class Mixed(self._getTargetClass(), AuditedContainer):
+            pass
+
+        Mixed()._validate(())
+        self.assertEqual(validated, [()])
+
 
 class OrderableTests(unittest.TestCase):
 
@@ -925,6 +1003,11 @@ class MinMaxLenTests(LenTestsMixin,
         mml = self._makeOne(max_length=2)
         self.assertRaisesTooLong(mml, (0, 1, 2))
 
+    def test_validate_wo_bounds(self):
+        mml = self._makeOne(min_length=None)
+        mml.validate(())
+        mml.validate(object())  # length is never checked
+
 
 class TextTests(EqualityTestsMixin,
                 WrongTypeTestsMixin,
@@ -1410,7 +1493,12 @@ class ObjectTests(EqualityTestsMixin,
 
     def tearDown(self):
         from zope.event import subscribers
+        from zope.schema import _bootstrapfields
         subscribers[:] = self._before
+        executor, _ = _bootstrapfields._validation_executor
+        if executor is not None:
+            executor.shutdown()
+            _bootstrapfields._validation_executor = (None, None)
 
     def _getTargetClass(self):
         from zope.schema._field import Object
@@ -1634,6 +1722,53 @@ class ObjectTests(EqualityTestsMixin,
         objf = self._makeOne(schema)
         objf.validate(OK())  # doesn't raise
 
+    def test__validate_w_equal_schemas_with_different_fields(self):
+        # Interfaces with the same name and module compare equal, but
+        # each must be validated using its own fields.
+        from zope.interface import implementer
+        from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+        from zope.schema._bootstrapfields import Text
+        schema = self._makeSchema(foo=Text())
+        other_schema = self._makeSchema(bar=Text())
+        self.assertEqual(schema, other_schema)
+
+        @implementer(schema, other_schema)
+        class Foo(object):
+            foo = u'Foo'
+
+        self._makeOne(schema).validate(Foo())  # doesn't raise
+        with self.assertRaises(SchemaNotCorrectlyImplemented) as exc:
+            self._makeOne(other_schema).validate(Foo())
+        self.assertEqual(['bar'], list(exc.exception.schema_errors))
+
+    def test__validate_after_schema_bases_change(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+        from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+        from zope.schema._bootstrapfields import Text
+
+        class IBase(Interface):
+            bar = Text()
+
+        # Interfaces hash and compare by name and module. Changing the
+        # bases looks the schema up in the weak ``_dependents`` mapping
+        # of its old base, where the entry of another (possibly
+        # collected) ISchema from _makeSchema would compare equal. So
+        # give this schema a name of its own.
+        class IChangingBases(Interface):
+            foo = Text()
+
+        @implementer(IChangingBases)
+        class Foo(object):
+            foo = u'Foo'
+
+        objf = self._makeOne(IChangingBases)
+        objf.validate(Foo())  # doesn't raise
+        IChangingBases.__bases__ = (IBase,)
+        with self.assertRaises(SchemaNotCorrectlyImplemented) as exc:
+            objf.validate(Foo())
+        self.assertEqual(['bar'], list(exc.exception.schema_errors))
+
     def test_validate_w_cycles(self):
         IUnit, Person, Unit = self._makeCycles()
         field = self._makeOne(schema=IUnit)
@@ -1812,6 +1947,146 @@ class ObjectTests(EqualityTestsMixin,
         field = self._makeOne(ISchema, validate_invariants=False)
         field.validate(inst)
 
+    def test_ctor_validate_parallel(self):
+        self.assertFalse(self._makeOne().validate_parallel)
+        field = self._makeOne(validate_parallel=True)
+        self.assertTrue(field.validate_parallel)
+
+    def test__validate_parallel(self):
+        import threading
+        from zope.interface import implementer
+        from zope.schema.interfaces import RequiredMissing
+        from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+        from zope.schema.interfaces import SchemaNotFullyImplemented
+        from zope.schema.interfaces import WrongType
+        from zope.schema._bootstrapfields import Text
+        schema = self._makeSchema(foo=Text(), bar=Text(), baz=Text(),
+                                  qux=Text())
+        threads = set()
+
+        @implementer(schema)
+        class Broken(object):
+            bar = None
+            baz = 1
+
+            @property
+            def qux(self):
+                threads.add(threading.current_thread())
+                return u'Qux'
+
+        field = self._makeOne(schema, validate_parallel=True)
+        errors = self._getErrors(field.validate, Broken())
+        self.assertEqual(
+            sorted(type(e).__name__ for e in errors),
+            ['RequiredMissing', 'SchemaNotFullyImplemented', 'WrongType'])
+        self.assertNotIn(threading.current_thread(), threads)
+
+        broken = Broken()
+        with self.assertRaises(SchemaNotCorrectlyImplemented) as exc:
+            field.validate(broken)
+        schema_errors = exc.exception.schema_errors
+        self.assertEqual(['bar', 'baz', 'foo'], sorted(schema_errors))
+        self.assertIsInstance(schema_errors['foo'], SchemaNotFullyImplemented)
+        self.assertIsInstance(schema_errors['bar'], RequiredMissing)
+        self.assertIsInstance(schema_errors['baz'], WrongType)
+
+        # The same as validating sequentially
+        sequential = self._makeOne(schema)
+        with self.assertRaises(SchemaNotCorrectlyImplemented) as exc:
+            sequential.validate(broken)
+        self.assertEqual(
+            {k: type(v) for k, v in schema_errors.items()},
+            {k: type(v) for k, v in exc.exception.schema_errors.items()})
+
+    def test__validate_parallel_w_thread_local_state(self):
+        # Validation that depends on the thread-local state of the
+        # caller (like a site-based vocabulary lookup) gives the same
+        # result as sequential validation.
+        import threading
+        from zope.interface import implementer
+        from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+        from zope.schema.interfaces import SchemaNotFullyImplemented
+        from zope.schema.interfaces import WrongType
+        from zope.schema._bootstrapfields import Text
+        local = threading.local()
+        local.site = u'site'
+        schema = self._makeSchema(
+            foo=Text(),
+            bar=Text(constraint=lambda value: getattr(local, 'site', None)),
+            baz=Text())
+
+        @implementer(schema)
+        class Value(object):
+            bar = u'Bar'
+            baz = u'Baz'
+
+            @property
+            def foo(self):
+                return local.site
+
+        field = self._makeOne(schema, validate_parallel=True)
+        field.validate(Value())  # doesn't raise
+
+        # Errors found in the calling thread are still reported.
+        value = Value()
+        value.baz = 1
+        del local.site
+        with self.assertRaises(SchemaNotCorrectlyImplemented) as exc:
+            field.validate(value)
+        schema_errors = exc.exception.schema_errors
+        self.assertEqual(['bar', 'baz', 'foo'], sorted(schema_errors))
+        self.assertIsInstance(schema_errors['foo'], SchemaNotFullyImplemented)
+        self.assertIsInstance(schema_errors['baz'], WrongType)
+
+    def test__validate_parallel_w_single_field(self):
+        import threading
+        from zope.interface import implementer
+        from zope.schema._bootstrapfields import Text
+        schema = self._makeSchema(foo=Text())
+        threads = []
+
+        @implementer(schema)
+        class OK(object):
+            @property
+            def foo(self):
+                threads.append(threading.current_thread())
+                return u'Foo'
+
+        self._makeOne(schema, validate_parallel=True).validate(OK())
+        # Not worth handing off to another thread
+        self.assertEqual([threading.current_thread()], threads)
+
+    def test_validate_w_cycles_parallel(self):
+        from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+        IUnit, Person, Unit = self._makeCycles()
+        IUnit['boss'].validate_parallel = True
+        IUnit['members'].value_type.validate_parallel = True
+        field = self._makeOne(schema=IUnit, validate_parallel=True)
+        person1 = Person(None)
+        person2 = Person(None)
+        unit = Unit(person1, [person1, person2])
+        person1.unit = unit
+        person2.unit = unit
+        field.validate(unit)  # doesn't raise
+
+        unit.members.append(Person(object()))
+        self.assertRaises(SchemaNotCorrectlyImplemented, field.validate, unit)
+
+    def test__get_validation_executor(self):
+        from zope.schema import _bootstrapfields
+        executor = _bootstrapfields._get_validation_executor()
+        self.assertIs(executor, _bootstrapfields._get_validation_executor())
+
+        # A new one is created in a forked process
+        before = _bootstrapfields._validation_executor
+        _bootstrapfields._validation_executor = (executor, -1)
+        try:
+            new_executor = _bootstrapfields._get_validation_executor()
+            self.assertIsNot(new_executor, executor)
+            new_executor.shutdown()
+        finally:
+            _bootstrapfields._validation_executor = before
+
     def test_schema_defined_by_subclass(self):
         from zope import interface
         from zope.schema.interfaces import SchemaNotProvided
@@ -1934,6 +2209,46 @@ class ObjectTests(EqualityTestsMixin,
         self.assertIn(":Must Provide: :class:", doc)
 
 
+class BeforeObjectAssignedEventTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema._bootstrapfields import BeforeObjectAssignedEvent
+        return BeforeObjectAssignedEvent
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_class_conforms_to_IBeforeObjectAssignedEvent(self):
+        from zope.interface.verify import verifyClass
+        from zope.schema.interfaces import IBeforeObjectAssignedEvent
+        verifyClass(IBeforeObjectAssignedEvent, self._getTargetClass())
+
+    def test_instance_conforms_to_IBeforeObjectAssignedEvent(self):
+        from zope.interface.verify import verifyObject
+        from zope.schema.interfaces import IBeforeObjectAssignedEvent
+        event = self._makeOne(self, 'name', None)
+        verifyObject(IBeforeObjectAssignedEvent, event)
+        self.assertIs(event.object, self)
+        self.assertEqual(event.name, 'name')
+        self.assertIsNone(event.context)
+
+    def test_no_instance_dict(self):
+        event = self._makeOne(self, 'name', None)
+        self.assertFalse(hasattr(event, '__dict__'))
+
+    def test_alsoProvides(self):
+        from zope.interface import Interface
+        from zope.interface import alsoProvides
+        from zope.schema.interfaces import IBeforeObjectAssignedEvent
+
+        class IMarker(Interface):
+            pass
+        event = self._makeOne(self, 'name', None)
+        alsoProvides(event, IMarker)
+        self.assertTrue(IMarker.providedBy(event))
+        self.assertTrue(IBeforeObjectAssignedEvent.providedBy(event))
+
+
 class DummyInst(object):
     missing_value = object()
 
@@ -839,9 +839,35 @@ class URITests(EqualityTestsMixin,
 
         self.assertRaises(InvalidURI, field.validate, 'abc')
         self.assertRaises(InvalidURI, field.validate, '\xab\xde')
+        self.assertRaises(InvalidURI, field.validate, ':no-scheme')
+        self.assertRaises(InvalidURI, field.validate, 'http://example.com/ x')
         self.assertRaises(ConstraintNotSatisfied,
                           field.validate, 'http://example.com/\nDAV:')
 
+    def test_validate_scheme_chars(self):
+        from zope.schema.interfaces import InvalidURI
+        field = self._makeOne()
+        field.validate('urn:isbn:0451450523')
+        field.validate('svn+ssh://example.com/')
+        field.validate('x-my.scheme1:')
+        # Only letters, digits, '+', '-' and '.' are allowed
+        self.assertRaises(InvalidURI, field.validate, 'my_scheme:foo')
+        self.assertRaises(InvalidURI, field.validate, 'my[scheme]:foo')
+        self.assertRaises(InvalidURI, field.validate, 'my scheme:foo')
+        self.assertRaises(InvalidURI, field.validate, 'http: ')
+
+    def test_validate_long_values(self):
+        # The URI pattern is matched in linear time, whether or not
+        # the value is valid.
+        from zope.schema.interfaces import InvalidURI
+        field = self._makeOne()
+        field.validate('http://example.com/' + 'a' * 100000)
+        field.validate('x' * 100000 + ':')
+        self.assertRaises(InvalidURI,
+                          field.validate, 'http://example.com/' + 'a ' * 50000)
+        self.assertRaises(InvalidURI, field.validate, 'x' * 100000 + '_:')
+        self.assertRaises(InvalidURI, field.validate, 'x' * 100000)
+
     def test_fromUnicode_ok(self):
 
         field = self._makeOne()
@@ -993,15 +1019,47 @@ class DottedNameTests(EqualityTestsMixin,
         self.assertIs(invalid.field, field)
         self.assertEqual(invalid.value, 'moar.dotted.name')
 
+    def test_validate_w_min_and_max_dots(self):
+        from zope.schema.interfaces import InvalidDottedName
+        field = self._makeOne(min_dots=1, max_dots=2)
+        self.assertRaises(InvalidDottedName, field.validate, 'name')
+        field.validate('dotted.name')
+        field.validate('moar.dotted.name')
+        self.assertRaises(InvalidDottedName,
+                          field.validate, 'even.moar.dotted.name')
+
+    def test_validate_wo_bounds(self):
+        field = self._makeOne()
+        field.validate('name')
+        field.validate('.'.join(['name'] * 100))
+
     def test_validate_not_a_dotted_name(self):
         from zope.schema.interfaces import ConstraintNotSatisfied
         from zope.schema.interfaces import InvalidDottedName
         field = self._makeOne()
         self.assertRaises(InvalidDottedName, field.validate, '')
         self.assertRaises(InvalidDottedName, field.validate, '\xab\xde')
+        self.assertRaises(InvalidDottedName, field.validate, 'dotted.')
+        self.assertRaises(InvalidDottedName, field.validate, 'dotted..name')
+        self.assertRaises(InvalidDottedName, field.validate, 'dotted.1name')
         self.assertRaises(ConstraintNotSatisfied,
                           field.validate, 'http://example.com/\nDAV:')
 
+    def test_validate_long_values(self):
+        # The unambiguous identifier pattern ([a-zA-Z_]\w*, repeated
+        # after dots) is matched in linear time, whether or not the
+        # value is valid. The old [a-zA-Z_]+\w* took seconds to reject
+        # values like these.
+        from zope.schema.interfaces import InvalidDottedName
+        field = self._makeOne(max_dots=20000)
+        name = '.'.join(['name'] * 20000)
+        field.validate('_' * 100000)
+        field.validate(name)
+        self.assertRaises(InvalidDottedName, field.validate, name + '.')
+        self.assertRaises(InvalidDottedName, field.validate, name + '!')
+        self.assertRaises(InvalidDottedName,
+                          field.validate, 'a' * 100000 + '-')
+
     def test_fromUnicode_dotted_name_ok(self):
         field = self._makeOne()
         self.assertEqual(field.fromUnicode(u'dotted.name'), 'dotted.name')
@@ -1467,6 +1525,33 @@ class ListTests(MutableSequenceTests):
         with self.assertRaises(WrongType):
             super(ListTests, self).test_mutable_sequence()
 
+    def test_validate_unique_w_unhashable_items(self):
+        from zope.schema.interfaces import NotUnique
+        field = self._makeOne(unique=True)
+        field.validate([[1], [2], {'a': 1}, 1, 2])
+        with self.assertRaises(NotUnique) as exc:
+            field.validate([[1], 2, [1]])
+        self.assertEqual(exc.exception.args, ([1],))
+        with self.assertRaises(NotUnique) as exc:
+            field.validate([[1], 2, 2])
+        self.assertEqual(exc.exception.args, (2,))
+
+    def test_validate_unique_w_set_items(self):
+        from zope.schema.interfaces import NotUnique
+        field = self._makeOne(unique=True)
+        field.validate([{1}, {2}])
+        field.validate([{1}, frozenset({2})])
+        with self.assertRaises(NotUnique) as exc:
+            field.validate([{1}, {2}, {1}])
+        self.assertEqual(exc.exception.args, ({1},))
+        # Sets and frozensets with the same members are equal.
+        with self.assertRaises(NotUnique) as exc:
+            field.validate([{1}, frozenset({1})])
+        self.assertEqual(exc.exception.args, (frozenset({1}),))
+        with self.assertRaises(NotUnique) as exc:
+            field.validate([frozenset({1}), {1}])
+        self.assertEqual(exc.exception.args, ({1},))
+
 
 class SetTests(WrongTypeTestsMixin,
                CollectionTests):
@@ -1605,6 +1690,24 @@ class MappingTests(EqualityTestsMixin,
         self.assertIsInstance(wct.errors[0], WrongType)
         self.assertIs(field.value_type._type, wct.errors[0].expected_type)
 
+    def test_validate_invalid_key_and_value_types(self):
+        from collections import OrderedDict
+        from zope.schema.interfaces import WrongContainedType
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapfields import Text
+        field = self._makeOne(key_type=Int(), value_type=Text())
+        field.validate({})
+        field.validate({1: u'b', 2: u'd'})
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate(OrderedDict([(u'a', 1), (2, 3), (4, u'e')]))
+
+        wct = exc.exception
+        self.assertIs(wct.field, field)
+        # All the value errors are reported before the key errors.
+        self.assertEqual([1, 3, u'a'], [e.value for e in wct.errors])
+        self.assertEqual([field.value_type, field.value_type, field.key_type],
+                         [e.field for e in wct.errors])
+
     def test_validate_min_length(self):
         field = self._makeOne(min_length=1)
         field.validate({1: 'a'})